@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared helpers for the Python launcher scripts (run.py, play_latest.py,
+play_story_choice.py)
+"""
+
+import os
+import sys
+import time
+
+# Where a successful Node.js check is remembered, and for how long (seconds)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jsda")
+NODE_CHECK_TTL = 24 * 60 * 60
+
+# statx(2) constants and the offset of stx_mtime inside struct statx
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_MTIME = 0x40
+STATX_BUFFER_SIZE = 256
+STATX_MTIME_OFFSET = 112
+
+
+_statx = None
+_statx_loaded = False
+
+
+def _load_statx():
+    """Return libc's statx() on Linux, or None if it is unavailable
+
+    Loaded on first use, so launchers that never look at a story do not pay
+    for importing ctypes and opening libc.
+    """
+    global _statx, _statx_loaded
+    if not _statx_loaded:
+        if sys.platform.startswith('linux'):
+            import ctypes
+            try:
+                statx = ctypes.CDLL(None).statx
+                statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_void_p]
+                statx.restype = ctypes.c_int
+                _statx = statx
+            except (OSError, AttributeError):
+                pass
+        _statx_loaded = True
+    return _statx
+
+
+def mtime_cached(entry):
+    """Return the modification time of an os.DirEntry, trusting cached attributes
+
+    On Linux this uses statx(AT_STATX_DONT_SYNC), which lets NFS and other
+    network filesystems answer from their attribute cache instead of making
+    a round trip to the server. Elsewhere it is entry.stat(), which on
+    Windows comes for free from the directory listing.
+    """
+    statx = _load_statx()
+    if statx is not None:
+        import ctypes
+        import struct
+        buf = ctypes.create_string_buffer(STATX_BUFFER_SIZE)
+        if statx(AT_FDCWD, os.fsencode(entry.path), AT_STATX_DONT_SYNC, STATX_MTIME, buf) == 0:
+            (mask,) = struct.unpack_from("I", buf, 0)
+            if mask & STATX_MTIME:
+                sec, nsec = struct.unpack_from("qI", buf, STATX_MTIME_OFFSET)
+                return sec + nsec / 1e9
+    # Any statx failure (e.g. blocked by a seccomp profile) falls back to
+    # entry.stat(), which raises the appropriate error itself
+    return entry.stat().st_mtime
+
+
+def node_ok():
+    """Check that Node.js is available, remembering a success for a day
+
+    The result is keyed by a hash of $PATH, so changing PATH (e.g. switching
+    Node versions) triggers a fresh check.
+    """
+    import hashlib
+    import shutil
+
+    path_hash = hashlib.md5(os.environ.get("PATH", "").encode(), usedforsecurity=False).hexdigest()
+    marker = os.path.join(CACHE_DIR, f"node_ok_{path_hash}")
+
+    try:
+        if time.time() - os.stat(marker).st_mtime < NODE_CHECK_TTL:
+            return True
+    except OSError:
+        pass
+
+    # Finding the executable on PATH is enough; a broken install still
+    # surfaces as an error when run_story.js is started
+    if shutil.which("node") is None:
+        return False
+
+    # Failing to write the cache only costs a re-check next time
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(marker, "a"):
+            pass
+        os.utime(marker)
+    except OSError:
+        pass
+
+    return True
+
+
+def _is_utf8(stream):
+    return (getattr(stream, 'encoding', None) or '').lower().replace('-', '').startswith('utf8')
+
+
+def setup_windows_console():
+    """Fix Windows console encoding for emojis
+
+    Streams that are already UTF-8 (Windows Terminal, PYTHONUTF8=1) are left
+    alone, so printing does not go through an extra Python-level writer.
+    """
+    if sys.platform.startswith('win'):
+        import codecs
+        if not _is_utf8(sys.stdout):
+            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'replace')
+        if not _is_utf8(sys.stderr):
+            sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'replace')
+
+
+def wait_for_key(action="exit"):
+    """Prompt "Press ... to <action>..." and wait for the user to respond
+
+    Unix terminals read a single key in cbreak mode rather than a line via
+    input(), so any key will do; Windows keeps input() and asks for Enter.
+    Without a terminal there is nobody to wait for, so this returns
+    immediately.
+    """
+    if sys.platform.startswith('win'):
+        try:
+            input(f"Press Enter to {action}...")
+        except (EOFError, KeyboardInterrupt):
+            pass
+        return
+
+    sys.stdout.write(f"Press any key to {action}...")
+    sys.stdout.flush()
+    if sys.stdin.isatty():
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            os.read(fd, 1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # TCSAFLUSH discards the rest of a multi-byte key (arrows,
+            # function keys) so it does not leak into the shell
+            termios.tcsetattr(fd, termios.TCSAFLUSH, old_settings)
+    print()
+
+
+def pause(prompt="Press Enter to close..."):
+    """Keep a double-clicked Windows console open until the user responds"""
+    if sys.platform.startswith('win') and sys.stdin.isatty():
+        try:
+            input(prompt)
+        except (EOFError, KeyboardInterrupt):
+            pass
+
+
+def require_node(wait=False):
+    """Exit with an error unless Node.js is available
+
+    With wait=True the user is asked to press a key before exiting, so the
+    message stays visible in a console window opened just for this script.
+    """
+    if node_ok():
+        return
+    print("❌ Error: Node.js is required but not found")
+    print("Please install Node.js: https://nodejs.org/")
+    if wait:
+        wait_for_key()
+    sys.exit(1)
+
+
+def require_files(required_files, wait=False):
+    """Exit with an error unless all required_files exist in the current directory"""
+    # One directory listing instead of a stat per required file
+    with os.scandir(".") as it:
+        present = {e.name for e in it}
+    missing_files = [f for f in required_files if f not in present]
+    if missing_files:
+        print(f"❌ Error: Missing required files: {', '.join(missing_files)}")
+        if wait:
+            wait_for_key()
+        sys.exit(1)
+
+
+def find_latest_story():
+    """Find the most recent story file in stories/ directory
+
+    Returns the path of the newest story, or None if there is none. This is
+    a single streaming pass, so memory use does not grow with the directory.
+    """
+    try:
+        it = os.scandir("stories")
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    best = None
+    best_mtime = None
+    with it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file():
+                mtime = mtime_cached(entry)
+                if best is None or mtime > best_mtime:
+                    best_mtime = mtime
+                    best = entry.path
+    return best
+
+
+def run_story(story_file):
+    """Run a story interactively with node run_story.js
+
+    On Unix this does not return: the Python process becomes node.
+    """
+    try:
+        cmd = ["node", "run_story.js", str(story_file)]
+        print(f"🚀 Running: {' '.join(cmd)}")
+        print("=" * 50)
+        print()
+
+        # The end-of-session pause only applies on Windows, so elsewhere
+        # replace this process with node instead of forking and waiting
+        if not sys.platform.startswith('win'):
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execvp("node", cmd)
+
+        # Run in current console window (no new window)
+        import subprocess
+        subprocess.call(cmd, cwd=".")
+
+        print("\n" + "=" * 50)
+        print("🎮 Game session ended.")
+        pause()
+
+    except KeyboardInterrupt:
+        print("\n\n👋 Story interrupted by user. Goodbye!")
+    except Exception as e:
+        print(f"❌ Error running story: {e}")
+        pause("\nPress Enter to close...")
+        sys.exit(1)
@@ -1,10 +1,85 @@
+import ctypes
+import errno
 import os
-import glob
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+
+AT_FDCWD = -100
+RENAME_NOREPLACE = 1
+
+
+def _load_renameat2():
+    """Return libc's renameat2() on Linux, or None if it is unavailable"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+
+_renameat2 = _load_renameat2()
+
+
+def _rename_noreplace(src, dst):
+    """Rename src to dst, raising FileExistsError if dst already exists
+
+    On Linux this is a single atomic renameat2(RENAME_NOREPLACE) call.
+    Windows uses os.rename, which refuses to overwrite there. Elsewhere, or
+    when the filesystem lacks RENAME_NOREPLACE, the file is hard-linked to
+    dst (which fails if dst exists) and src is then unlinked. Only on a
+    filesystem that supports neither RENAME_NOREPLACE nor hard links does
+    this fall back to os.rename, which can overwrite dst.
+    """
+    if _renameat2 is not None:
+        if _renameat2(AT_FDCWD, os.fsencode(src), AT_FDCWD, os.fsencode(dst), RENAME_NOREPLACE) == 0:
+            return
+        err = ctypes.get_errno()
+        # EINVAL/ENOSYS: the filesystem or kernel lacks the flag, fall through
+        if err not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(err, os.strerror(err), src, None, dst)
+
+    if sys.platform.startswith('win'):
+        os.rename(src, dst)
+        return
+
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        # FileExistsError propagates; otherwise check for missing link support
+        if e.errno not in (errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV, errno.EMLINK):
+            raise
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+
+def _rename(pair):
+    """Rename a single file, returning the error (if any) instead of raising"""
+    src, dst = pair
+    try:
+        _rename_noreplace(src, dst)
+        return None
+    except OSError as e:
+        return e
+
+
 def rename_images_by_age():
-    # Get all jpg files in current directory
-    jpg_files = glob.glob('*.jpg') + glob.glob('*.JPG') + glob.glob('*.jpeg') + glob.glob('*.JPEG')
+    # Get all jpg files in current directory in a single pass, along with
+    # their modification times (DirEntry caches the stat result). Hidden
+    # files (e.g. macOS ._ AppleDouble files) are skipped, as glob() did.
+    jpg_files = []
+    with os.scandir('.') as it:
+        for entry in it:
+            if (not entry.name.startswith('.') and entry.is_file(follow_symlinks=False)
+                    and entry.name.lower().endswith(('.jpg', '.jpeg'))):
+                jpg_files.append(entry)
 
     if not jpg_files:
         print("No JPG files found in current directory")
@@ -12,10 +87,9 @@ def rename_images_by_age():
 
     # Get file info with modification times
     file_info = []
-    for file in jpg_files:
-        if not file.startswith('0'):  # Skip already renamed files
-            mtime = os.path.getmtime(file)
-            file_info.append((file, mtime))
+    for entry in jpg_files:
+        if not entry.name.startswith('0'):  # Skip already renamed files
+            file_info.append((entry.name, entry.stat().st_mtime))
 
     if not file_info:
         print("No files to rename (all files already renamed or no valid files)")
@@ -24,22 +98,49 @@ def rename_images_by_age():
     # Sort by modification time (newest first)
     file_info.sort(key=lambda x: x[1], reverse=True)
 
-    # Rename files
-    for i, (old_name, _) in enumerate(file_info):
-        new_name = f"{i:04d}.jpg"
-
-        # Check if target name already exists
-        if os.path.exists(new_name):
-            print(f"Warning: {new_name} already exists, skipping {old_name}")
+    # Phase 1: move every source out of the way to a unique temporary name,
+    # so no final name can collide with a file that is still to be renamed.
+    # The temporary name is not hidden and keeps the image suffix, so if the
+    # script stops before phase 2 a re-run still picks these files up.
+    moved = []
+    for old_name, _ in file_info:
+        tmp_name = f"rn_tmp_{uuid.uuid4().hex}_{old_name}"
+        try:
+            os.rename(old_name, tmp_name)
+        except OSError as e:
+            print(f"Error renaming {old_name}: {e}")
             continue
+        moved.append((old_name, tmp_name))
 
-        try:
-            os.rename(old_name, new_name)
+    # Names already taken by previously renamed files; new numbers skip them
+    # so a re-run never overwrites earlier results. Only files that phase 1
+    # actually moved get a number, so the numbering has no gaps.
+    taken = {entry.name for entry in jpg_files if entry.name.startswith('0')}
+    targets = []
+    number = 0
+    while len(targets) < len(moved):
+        new_name = f"{number:04d}.jpg"
+        if new_name not in taken:
+            targets.append(new_name)
+        number += 1
+    pending = [(old, tmp, new) for (old, tmp), new in zip(moved, targets)]
+
+    # Phase 2: temporary -> final names; renames are independent syscalls,
+    # so run them concurrently
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        errors = list(pool.map(_rename, [(tmp, new) for _, tmp, new in pending]))
+
+    renamed = 0
+    for (old_name, tmp_name, new_name), error in zip(pending, errors):
+        if error is None:
+            renamed += 1
             print(f"Renamed: {old_name} -> {new_name}")
-        except Exception as e:
-            print(f"Error renaming {old_name}: {e}")
+        elif isinstance(error, FileExistsError) and _rename((tmp_name, old_name)) is None:
+            print(f"Warning: {new_name} already exists, skipping {old_name}")
+        else:
+            print(f"Error renaming {old_name}: {error} (left as {tmp_name})")
 
-    print(f"\nRenamed {len(file_info)} files successfully")
+    print(f"\nRenamed {renamed} files successfully")
 
 if __name__ == "__main__":
     rename_images_by_age()
\ No newline at end of file
@@ -6,64 +6,64 @@ Usage: python play_story_choice.py
 """
 
 import os
-import subprocess
 import sys
-from pathlib import Path
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
-# Fix Windows console encoding for emojis
-if sys.platform.startswith('win'):
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'replace')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'replace')
+from _jsda_common import (mtime_cached, require_node, run_story, setup_windows_console,
+                          wait_for_key)
+
+setup_windows_console()
+
+# Below this many stories a thread pool costs more than the stats it overlaps
+PARALLEL_STAT_THRESHOLD = 16
+PARALLEL_STAT_WORKERS = 32
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def get_all_stories():
-    """Get all story files sorted by modification time (newest first)"""
-    stories_dir = Path("stories")
-    if not stories_dir.exists():
-        return []
+    """Get all story files sorted by modification time (newest first)
 
-    story_files = list(stories_dir.glob("*.json"))
-    if not story_files:
+    Returns a list of (name, path, mtime) tuples; the mtime is read once
+    here so callers never need to stat the files again.
+    """
+    try:
+        it = os.scandir("stories")
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    # Sort by modification time (newest first)
-    return sorted(story_files, key=lambda x: x.stat().st_mtime, reverse=True)
+    with it:
+        entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
 
+    def story_info(entry):
+        return entry.name, entry.path, mtime_cached(entry)
 
-def format_file_time(file_path):
-    """Format file modification time as readable string"""
-    mtime = file_path.stat().st_mtime
-    dt = datetime.fromtimestamp(mtime)
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    # On network filesystems each stat is a round trip, so overlap them
+    if len(entries) < PARALLEL_STAT_THRESHOLD:
+        stories = [story_info(e) for e in entries]
+    else:
+        with ThreadPoolExecutor(max_workers=PARALLEL_STAT_WORKERS) as pool:
+            stories = list(pool.map(story_info, entries))
+
+    # Sort by modification time (newest first)
+    stories.sort(key=itemgetter(2), reverse=True)
+    return stories
 
 
 def main():
     print("🎮 STORY SELECTOR")
     print("=" * 50)
 
-    # Check if Node.js is available
-    try:
-        startup_info = None
-        if sys.platform.startswith('win'):
-            startup_info = subprocess.STARTUPINFO()
-            startup_info.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startup_info.wShowWindow = subprocess.SW_HIDE
-
-        subprocess.run(["node", "--version"], check=True,
-                      capture_output=True, text=True, startupinfo=startup_info)
-        print("✅ Node.js is ready")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ Error: Node.js is required but not found")
-        input("Press Enter to exit...")
-        sys.exit(1)
+    require_node(wait=True)
+    print("✅ Node.js is ready")
 
     # Get all stories
     stories = get_all_stories()
     if not stories:
         print("❌ No story files found in stories/ directory")
-        input("Press Enter to exit...")
+        wait_for_key()
         sys.exit(1)
 
     print(f"\n📚 Found {len(stories)} stories:")
@@ -74,15 +74,16 @@ def main():
 
     if not available_stories:
         print("❌ Only one story found (the oldest). Generate more stories first.")
-        input("Press Enter to exit...")
+        wait_for_key()
         sys.exit(1)
 
-    # Display story options
-    for i, story in enumerate(available_stories, 1):
+    # Display story options, built up and written in one go
+    lines = []
+    for i, (name, _, mtime) in enumerate(available_stories, 1):
         age_info = "Latest" if i == 1 else f"{i} newest"
-        print(f"[{i}] {story.name}")
-        print(f"    Created: {format_file_time(story)} ({age_info})")
-        print()
+        created = time.strftime(TIME_FORMAT, time.localtime(mtime))
+        lines.append(f"[{i}] {name}\n    Created: {created} ({age_info})\n\n")
+    sys.stdout.write("".join(lines))
 
     # Get user choice
     while True:
@@ -90,7 +91,7 @@ def main():
             choice = input(f"📝 Choose story (1-{len(available_stories)}): ").strip()
             choice_num = int(choice)
             if 1 <= choice_num <= len(available_stories):
-                selected_story = available_stories[choice_num - 1]
+                selected_name, selected_path, _ = available_stories[choice_num - 1]
                 break
             else:
                 print(f"❌ Please enter a number between 1 and {len(available_stories)}")
@@ -100,34 +101,11 @@ def main():
             print("\n👋 Goodbye!")
             sys.exit(0)
 
-    print(f"\n🎮 Playing: {selected_story.name}")
+    print(f"\n🎮 Playing: {selected_name}")
     print("=" * 50)
     print()
 
-    # Run the selected story
-    try:
-        cmd = ["node", "run_story.js", str(selected_story)]
-        result = subprocess.call(cmd, cwd=".")
-
-        print("\n" + "=" * 50)
-        print("🎮 Game session ended.")
-
-        if sys.platform.startswith('win') and sys.stdin.isatty():
-            try:
-                input("Press Enter to close...")
-            except (EOFError, KeyboardInterrupt):
-                pass
-
-    except KeyboardInterrupt:
-        print("\n\n👋 Story interrupted by user. Goodbye!")
-    except Exception as e:
-        print(f"❌ Error running story: {e}")
-        if sys.platform.startswith('win') and sys.stdin.isatty():
-            try:
-                input("\nPress Enter to close...")
-            except (EOFError, KeyboardInterrupt):
-                pass
-
+    run_story(selected_path)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
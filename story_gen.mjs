@@ -0,0 +1,50 @@
+/**
+ * Story Generator Launcher
+ * Generates a new RPG story; used by `python run.py --generate`.
+ * Minimum page count is read from the MIN_PAGES environment variable;
+ * themes are picked at random from config/themes.json.
+ */
+
+import fs from 'fs';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { ClaudeStoryGenerator } from './StoryGenerator.js';
+import { StorySystem } from './StorySystem.js';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const themesPath = path.join(__dirname, 'config', 'themes.json');
+const minPages = parseInt(process.env.MIN_PAGES, 10) || 50;
+
+async function generateStory() {
+    const storySystem = new StorySystem();
+    const generator = new ClaudeStoryGenerator(storySystem);
+
+    const themes = JSON.parse(fs.readFileSync(themesPath, 'utf8'));
+
+    const theme = themes[Math.floor(Math.random() * themes.length)];
+    console.log(`🎨 Theme: ${theme}`);
+
+    try {
+        const story = await generator.generateLongStory(theme, minPages);
+        if (story) {
+            console.log(`✅ Story generated: "${story.title}"`);
+            console.log(`📄 Pages: ${Object.keys(story.pages).length}`);
+            return story;
+        } else {
+            console.log("❌ Story generation failed");
+            return null;
+        }
+    } catch (error) {
+        console.error("❌ Generation error:", error.message);
+        return null;
+    }
+}
+
+generateStory().then(story => {
+    if (story) {
+        console.log(`🏆 New story ready to play!`);
+        process.exit(0);
+    } else {
+        process.exit(1);
+    }
+});